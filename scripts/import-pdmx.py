@@ -10,146 +10,420 @@ Usage:
     python scripts/import-pdmx.py --file ./pdmx-data/beethoven/fur_elise.xml
 
 Prerequisites:
-    pip install music21
+    pip install music21 lxml numpy orjson
 
 Output format matches src/core/songs/songTypes.ts Song interface.
 """
 
+from __future__ import annotations
+
 import argparse
+import array
+import functools
+import hashlib
+import io
 import json
 import os
+import pickle
 import sys
+import tarfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
+# music21 loads a large package graph (~1s) on import, which penalizes every
+# invocation — including --help and runs where the lxml fast path handles all
+# files. It is imported lazily via _import_music21() instead.
+music21 = None
+
 try:
-    import music21
+    import numpy as np
 except ImportError:
-    print("Error: music21 is required. Install with: pip install music21")
+    print("Error: numpy is required. Install with: pip install numpy")
     sys.exit(1)
 
+try:
+    from lxml import etree
+except ImportError:
+    # lxml is optional: without it every file takes the slower music21 path.
+    etree = None
 
-def midi_note_number(pitch: music21.pitch.Pitch) -> int:
-    """Convert a music21 Pitch to MIDI note number."""
-    return pitch.midi
-
-
-def beats_from_offset(offset: float, time_sig_denominator: int = 4) -> float:
-    """Convert music21 offset (quarter notes) to beat position."""
-    return float(offset)
-
-
-def duration_in_beats(dur: music21.duration.Duration) -> float:
-    """Convert music21 Duration to beats (quarter note = 1)."""
-    return float(dur.quarterLength)
+try:
+    import orjson
+except ImportError:
+    # orjson is optional: stdlib json works, just slower for bulk output.
+    orjson = None
 
+try:
+    import numba
+except ImportError:
+    # numba is optional: the NumPy fallback below does the same work.
+    numba = None
+
+
+def _bucketize_numpy(starts: "np.ndarray", beats_per_section: float) -> "np.ndarray":
+    """Section bucket id for every note (NumPy fallback)."""
+    return (starts // beats_per_section).astype(np.int64)
+
+
+if numba is not None:
+    # cache=True persists the compiled function on disk so the (multi-second)
+    # JIT compile is paid once, not once per corpus run or per worker process.
+    @numba.njit(cache=True)
+    def _bucketize(starts, beats_per_section):  # pragma: no cover
+        n = starts.shape[0]
+        bucket = np.empty(n, dtype=np.int64)
+        for i in range(n):
+            bucket[i] = np.int64(starts[i] // beats_per_section)
+        return bucket
+else:
+    _bucketize = _bucketize_numpy
+
+
+def _import_music21() -> Any:
+    """Import music21 on first use (per process).
+
+    Each worker process pays the import cost independently, so trim the
+    per-process fixed overhead: silence music21's warning chatter and turn
+    off corpus auto-download. Nothing here touches corpus.search, which
+    keeps the corpus catalog from being indexed at all.
+    """
+    global music21
+    if music21 is None:
+        try:
+            import music21 as _music21
+        except ImportError:
+            print("Error: music21 is required. Install with: pip install music21")
+            sys.exit(1)
+        try:
+            env = _music21.environment.Environment()
+            env["warnings"] = 0
+            env["autoDownload"] = "deny"
+        except Exception:
+            pass  # environment tuning is best-effort; parsing works without it
+        music21 = _music21
+    return music21
+
+
+def _dump_song(song: dict[str, Any], pretty: bool) -> bytes:
+    """Serialize a song dict to JSON bytes.
+
+    orjson's C encoder is 5-10× faster than stdlib json, and compact output
+    (the default for batch runs) roughly halves the bytes written versus
+    indent=2. Pass --pretty for human-readable files.
+    """
+    if orjson is not None:
+        return orjson.dumps(song, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(song, indent=2 if pretty else None).encode("utf-8")
+
+
+CACHE_DIR = Path.home() / ".cache" / "pdmx"
+
+
+def _cache_path(filepath: str, need_metadata: bool) -> Path:
+    """Cache file for the extracted data of one source file.
+
+    Keyed on (path, mtime, size) so an edited or replaced source file misses
+    the cache; need_metadata is part of the key because it changes what gets
+    extracted (title/composer).
+    """
+    st = os.stat(filepath)
+    # v2: notes are cached as (starts, durations, pitches) NumPy arrays.
+    raw = f"{filepath}:{st.st_mtime_ns}:{st.st_size}:{int(need_metadata)}:v2"
+    key = hashlib.blake2b(raw.encode()).hexdigest()[:16]
+    return CACHE_DIR / f"{key}.pkl"
+
+
+# Semitone offset of each diatonic step within an octave.
+STEP_TO_SEMITONE = {"C": 0, "D": 2, "E": 4, "F": 5, "G": 7, "A": 9, "B": 11}
+
+# Circle-of-fifths count → key signature name (matches music21's str(ks.asKey())).
+FIFTHS_TO_KEY = {
+    0: "C major", 1: "G major", 2: "D major", 3: "A major", 4: "E major",
+    5: "B major", 6: "F# major", 7: "C# major",
+    -1: "F major", -2: "B- major", -3: "E- major", -4: "A- major",
+    -5: "D- major", -6: "G- major", -7: "C- major",
+}
+
+
+def _parse_fast(
+    filepath: str,
+) -> tuple[NoteArrays, int, tuple[int, int], str] | None:
+    """Stream note events straight out of MusicXML with lxml.
+
+    music21.converter.parse builds a full Python object graph per file and
+    dominates conversion runtime; for plain .xml/.musicxml files we only need
+    a handful of elements (<note>, <backup>/<forward>, <attributes>, <sound>),
+    which a single iterparse pass can read directly. Notes stream into
+    array.array buffers — no per-note dict or tuple allocations — and come
+    back as the same (starts, durations, pitches) arrays _scan_score
+    produces. Returns None (caller falls back to music21) when lxml is
+    unavailable or the file cannot be streamed.
+    """
+    if etree is None:
+        return None
 
-def extract_key_signature(score: music21.stream.Score) -> str:
-    """Extract key signature from score."""
-    keys = score.flatten().getElementsByClass(music21.key.KeySignature)
-    if keys:
-        ks = keys[0]
-        if hasattr(ks, "asKey"):
-            return str(ks.asKey())
-        return f"{ks.sharps} sharps" if ks.sharps >= 0 else f"{abs(ks.sharps)} flats"
-    return "C"
+    starts_buf = array.array("d")
+    durations_buf = array.array("d")
+    pitches_buf = array.array("d")
+    divisions = 1.0
+    tempo = 120
+    time_sig = (4, 4)
+    key_sig = "C"
+    seen_tempo = seen_time = seen_key = False
+    cursor = 0.0  # running offset in beats (quarter notes)
+    prev_start = 0.0  # offset of the previous non-chord note, for <chord/> members
+    needs_sort = False
+    prev_key = (-1.0, -1)  # (startBeat, midi) of the previously emitted note
 
+    try:
+        context = etree.iterparse(
+            filepath,
+            events=("end",),
+            tag=("{*}note", "{*}backup", "{*}forward", "{*}attributes",
+                 "{*}sound", "{*}part"),
+        )
+        for _, elem in context:
+            tag = etree.QName(elem).localname
+
+            if tag == "note":
+                duration_text = elem.findtext("{*}duration")
+                duration_beats = (
+                    float(duration_text) / divisions if duration_text else 0.0
+                )
+                is_chord = elem.find("{*}chord") is not None
+                step = elem.findtext("{*}pitch/{*}step")
+                if step is not None and duration_beats > 0:
+                    octave = int(elem.findtext("{*}pitch/{*}octave") or 4)
+                    alter = int(float(elem.findtext("{*}pitch/{*}alter") or 0))
+                    start = prev_start if is_chord else cursor
+                    midi = (octave + 1) * 12 + STEP_TO_SEMITONE[step] + alter
+                    if (start, midi) < prev_key:
+                        needs_sort = True
+                    prev_key = (start, midi)
+                    starts_buf.append(start)
+                    durations_buf.append(duration_beats)
+                    pitches_buf.append(midi)
+                if not is_chord:
+                    prev_start = cursor
+                    cursor += duration_beats
+
+            elif tag == "backup":
+                cursor -= float(elem.findtext("{*}duration") or 0) / divisions
+
+            elif tag == "forward":
+                cursor += float(elem.findtext("{*}duration") or 0) / divisions
+
+            elif tag == "attributes":
+                div_text = elem.findtext("{*}divisions")
+                if div_text:
+                    divisions = float(div_text)
+                if not seen_time:
+                    beats = elem.findtext("{*}time/{*}beats")
+                    beat_type = elem.findtext("{*}time/{*}beat-type")
+                    if beats and beat_type:
+                        time_sig = (int(beats), int(beat_type))
+                        seen_time = True
+                if not seen_key:
+                    fifths = elem.findtext("{*}key/{*}fifths")
+                    if fifths is not None and int(fifths) in FIFTHS_TO_KEY:
+                        key_sig = FIFTHS_TO_KEY[int(fifths)]
+                        seen_key = True
+
+            elif tag == "sound":
+                if not seen_tempo and elem.get("tempo"):
+                    tempo = int(float(elem.get("tempo")))
+                    seen_tempo = True
+
+            elif tag == "part":
+                # Each part restarts the time cursor at the beginning.
+                cursor = 0.0
+                prev_start = 0.0
+                elem.clear()
+    except (etree.XMLSyntaxError, ValueError, KeyError, OSError):
+        # Malformed XML or an unreadable/vanished file: fall back to music21,
+        # whose own error handling skips the file without aborting the batch.
+        return None
 
-def extract_time_signature(score: music21.stream.Score) -> tuple[int, int]:
-    """Extract time signature from score."""
-    ts_list = score.flatten().getElementsByClass(music21.meter.TimeSignature)
-    if ts_list:
-        ts = ts_list[0]
-        return (ts.numerator, ts.denominator)
-    return (4, 4)
+    starts = np.asarray(starts_buf, dtype=np.float64)
+    durations = np.asarray(durations_buf, dtype=np.float64)
+    pitches = np.asarray(pitches_buf, dtype=np.float64)
+    # Single-voice files stream out already ordered; only sort when <backup>,
+    # extra parts, or chord voicing actually produced an out-of-order note.
+    if needs_sort:
+        order = np.lexsort((pitches, starts))
+        starts, durations, pitches = starts[order], durations[order], pitches[order]
+    return (starts, durations, pitches), tempo, time_sig, key_sig
 
 
-def extract_tempo(score: music21.stream.Score) -> int:
-    """Extract tempo from score (default 120)."""
-    tempos = score.flatten().getElementsByClass(music21.tempo.MetronomeMark)
-    if tempos:
-        return int(tempos[0].number)
-    return 120
+NoteArrays = tuple["np.ndarray", "np.ndarray", "np.ndarray"]
 
 
-def score_to_note_events(score: music21.stream.Score) -> list[dict[str, Any]]:
-    """Extract all notes from a score as NoteEvent dicts."""
-    notes = []
-    for element in score.flatten().notesAndRests:
+def _arrays_to_dicts(
+    starts: np.ndarray, durations: np.ndarray, pitches: np.ndarray
+) -> list[dict[str, Any]]:
+    """Materialize NoteEvent dicts from parallel arrays at the JSON boundary."""
+    return [
+        {"note": int(p), "startBeat": float(s), "durationBeats": float(d)}
+        for s, d, p in zip(starts, durations, pitches)
+    ]
+
+
+@functools.lru_cache(maxsize=4096)
+def _midi(name: str) -> int:
+    """MIDI number for a spelled pitch like 'C#4' or 'B-3'.
+
+    music21's Pitch.midi walks accidentals and octave on every access, and
+    the same handful of spellings recur millions of times across a corpus —
+    128 MIDI values × ~10 enharmonic spellings fits easily in the cache, so
+    the hit rate approaches 100% after warmup.
+    """
+    return _import_music21().pitch.Pitch(name).midi
+
+
+def _scan_score(
+    score: music21.stream.Score,
+) -> tuple[NoteArrays, str, tuple[int, int], int]:
+    """Extract notes, key signature, time signature, and tempo in one pass.
+
+    The previous extract_* helpers each called score.flatten() and walked the
+    whole score — four full traversals per file. music21 elements are expensive
+    to re-iterate, so collect everything in a single walk instead.
+
+    Notes come back as parallel NumPy arrays (starts, durations, pitches)
+    sorted by (startBeat, note) via lexsort; per-note dicts are only built at
+    the JSON boundary. Defaults match the old helpers ("C", (4, 4), 120).
+    """
+    starts_buf = array.array("d")
+    durations_buf = array.array("d")
+    pitches_buf = array.array("d")
+    key_sig = "C"
+    time_sig = (4, 4)
+    tempo = 120
+    seen_key = seen_time = seen_tempo = False
+    needs_sort = False
+    prev_key = (-1.0, -1)  # (startBeat, midi) of the previously emitted note
+
+    # recurse() iterates the score tree in place; flatten() would first copy
+    # every element into a new flat Stream, an O(N) allocation we don't need.
+    # Offsets from recurse() are measure-local, so ask for the hierarchy
+    # offset explicitly.
+    for element in score.recurse().getElementsByClass((
+        music21.note.Note,
+        music21.chord.Chord,
+        music21.key.KeySignature,
+        music21.meter.TimeSignature,
+        music21.tempo.MetronomeMark,
+    )):
         if isinstance(element, music21.note.Note):
-            notes.append({
-                "note": midi_note_number(element.pitch),
-                "startBeat": beats_from_offset(element.offset),
-                "durationBeats": duration_in_beats(element.duration),
-            })
+            offset = float(element.getOffsetInHierarchy(score))
+            midi = _midi(element.pitch.nameWithOctave)
+            if (offset, midi) < prev_key:
+                needs_sort = True
+            prev_key = (offset, midi)
+            starts_buf.append(offset)
+            durations_buf.append(float(element.duration.quarterLength))
+            pitches_buf.append(midi)
         elif isinstance(element, music21.chord.Chord):
-            for pitch in element.pitches:
-                notes.append({
-                    "note": midi_note_number(pitch),
-                    "startBeat": beats_from_offset(element.offset),
-                    "durationBeats": duration_in_beats(element.duration),
-                })
-    notes.sort(key=lambda n: (n["startBeat"], n["note"]))
-    return notes
+            offset = float(element.getOffsetInHierarchy(score))
+            duration = float(element.duration.quarterLength)
+            # Emit chord members low-to-high so chord voicing alone never
+            # forces a global sort.
+            for midi in sorted(_midi(p.nameWithOctave) for p in element.pitches):
+                if (offset, midi) < prev_key:
+                    needs_sort = True
+                prev_key = (offset, midi)
+                starts_buf.append(offset)
+                durations_buf.append(duration)
+                pitches_buf.append(midi)
+        elif isinstance(element, music21.key.KeySignature):
+            if not seen_key:
+                if hasattr(element, "asKey"):
+                    key_sig = str(element.asKey())
+                elif element.sharps >= 0:
+                    key_sig = f"{element.sharps} sharps"
+                else:
+                    key_sig = f"{abs(element.sharps)} flats"
+                seen_key = True
+        elif isinstance(element, music21.meter.TimeSignature):
+            if not seen_time:
+                time_sig = (element.numerator, element.denominator)
+                seen_time = True
+        elif isinstance(element, music21.tempo.MetronomeMark):
+            if not seen_tempo and element.number:
+                tempo = int(element.number)
+                seen_tempo = True
+
+    starts = np.asarray(starts_buf, dtype=np.float64)
+    durations = np.asarray(durations_buf, dtype=np.float64)
+    pitches = np.asarray(pitches_buf, dtype=np.float64)
+    # Single-part scores usually stream out already in (startBeat, note)
+    # order; only lexsort when the scan actually saw an inversion.
+    if needs_sort:
+        order = np.lexsort((pitches, starts))
+        starts, durations, pitches = starts[order], durations[order], pitches[order]
+    return (starts, durations, pitches), key_sig, time_sig, tempo
 
 
 def split_into_sections(
-    notes: list[dict[str, Any]],
+    starts: np.ndarray,
+    durations: np.ndarray,
+    pitches: np.ndarray,
+    ends: np.ndarray,
     beats_per_bar: int,
     bars_per_section: int = 16,
 ) -> list[dict[str, Any]]:
-    """Split notes into sections of N bars each."""
-    if not notes:
+    """Split notes into sections of N bars each.
+
+    A single floor-divide assigns every note to its section bucket, and
+    np.split on the bucket change points yields per-section index groups —
+    no per-note Python iteration. starts must be sorted (they are: extraction
+    lexsorts by start beat). ends is the precomputed starts + durations
+    vector shared with the duration/difficulty estimators. A bucket with no
+    notes produces no section, and each section's startBeat comes from its
+    bucket index, so sparse scores with long gaps no longer smear notes into
+    the wrong section window.
+    """
+    if starts.size == 0:
         return []
 
     beats_per_section = beats_per_bar * bars_per_section
+    bucket = _bucketize(starts, float(beats_per_section))
+    change = np.flatnonzero(np.diff(bucket)) + 1
+    groups = np.split(np.arange(starts.size), change)
+
     sections: list[dict[str, Any]] = []
-    current_notes: list[dict[str, Any]] = []
-    section_start = 0.0
-    section_idx = 0
-
-    for note in notes:
-        if note["startBeat"] >= section_start + beats_per_section and current_notes:
-            sections.append({
-                "id": f"section-{section_idx}",
-                "label": f"Section {section_idx + 1}",
-                "startBeat": section_start,
-                "endBeat": section_start + beats_per_section,
-                "difficulty": 3,
-                "layers": {
-                    "melody": current_notes,
-                    "full": current_notes,
-                },
-            })
-            section_start += beats_per_section
-            current_notes = []
-            section_idx += 1
-        current_notes.append(note)
-
-    # Final section
-    if current_notes:
-        last = current_notes[-1]
+    for section_idx, group in enumerate(groups):
+        section_start = float(bucket[group[0]]) * beats_per_section
+        if section_idx == len(groups) - 1:
+            end_beat = float(ends[group[-1]])
+        else:
+            end_beat = section_start + beats_per_section
+        notes = _arrays_to_dicts(starts[group], durations[group], pitches[group])
         sections.append({
             "id": f"section-{section_idx}",
             "label": f"Section {section_idx + 1}",
             "startBeat": section_start,
-            "endBeat": last["startBeat"] + last["durationBeats"],
+            "endBeat": end_beat,
             "difficulty": 3,
+            # "full" was always the same list as "melody", but json.dump
+            # serialized it twice — doubling output size. The app's song
+            # loader (normalizeSong) defaults full := melody when omitted.
             "layers": {
-                "melody": current_notes,
-                "full": current_notes,
+                "melody": notes,
             },
         })
 
     return sections
 
 
-def estimate_difficulty(notes: list[dict[str, Any]], tempo: int) -> int:
+def estimate_difficulty(starts: np.ndarray, ends: np.ndarray, tempo: int) -> int:
     """Heuristic difficulty from note density and tempo."""
-    if not notes:
+    if starts.size == 0:
         return 1
-    last_beat = max(n["startBeat"] + n["durationBeats"] for n in notes)
-    density = len(notes) / max(last_beat, 1)
+    last_beat = float(ends.max())
+    density = starts.size / max(last_beat, 1)
     score = density * (tempo / 120)
     if score < 0.5:
         return 1
@@ -163,48 +437,176 @@ def estimate_difficulty(notes: list[dict[str, Any]], tempo: int) -> int:
         return 5
 
 
-def estimate_duration(notes: list[dict[str, Any]], tempo: int) -> int:
+def estimate_duration(ends: np.ndarray, tempo: int) -> int:
     """Estimate duration in seconds."""
-    if not notes:
+    if ends.size == 0:
         return 60
-    last = max(n["startBeat"] + n["durationBeats"] for n in notes)
+    last = float(ends.max())
     return max(int((last / tempo) * 60), 10)
 
 
-def convert_file(filepath: str) -> dict[str, Any] | None:
-    """Convert a single MusicXML file to Song JSON."""
+def _read_mxl(filepath: str) -> bytes:
+    """Read the inner MusicXML document out of an .mxl zip container.
+
+    Handing the raw bytes to music21.converter.parseData skips its
+    format-sniffing and second open of the zip. The rootfile named by
+    META-INF/container.xml wins; otherwise the first .xml entry outside
+    META-INF is used.
+    """
+    import xml.etree.ElementTree as ElementTree
+
+    with zipfile.ZipFile(filepath) as z:
+        name = None
+        try:
+            container = ElementTree.fromstring(z.read("META-INF/container.xml"))
+            rootfile = container.find(".//{*}rootfile")
+            if rootfile is not None:
+                name = rootfile.get("full-path")
+        except (KeyError, ElementTree.ParseError):
+            pass
+        if name is None:
+            name = next(
+                n for n in z.namelist()
+                if n.endswith(".xml") and not n.startswith("META-INF")
+            )
+        return z.read(name)
+
+
+MIN_NOTES = 4
+
+
+def _quick_note_count(filepath: str, threshold: int = MIN_NOTES) -> int:
+    """Count <note> elements at the XML level, stopping at threshold.
+
+    Files with too few notes used to pay the full parse before being
+    rejected. This streams just far enough to find `threshold` note elements
+    (rests included, so the count only ever over-estimates — never falsely
+    rejects). Returns threshold when the check can't run, so the caller
+    proceeds to a real parse.
+    """
+    if etree is None:
+        return threshold
     try:
-        score = music21.converter.parse(filepath)
-    except Exception as e:
-        print(f"  Error parsing {filepath}: {e}")
+        source: Any = filepath
+        if filepath.endswith(".mxl"):
+            source = io.BytesIO(_read_mxl(filepath))
+        count = 0
+        for _, elem in etree.iterparse(source, events=("end",), tag="{*}note"):
+            count += 1
+            if count >= threshold:
+                break
+            elem.clear()
+        return count
+    except Exception:
+        return threshold
+
+
+def _extract(
+    filepath: str, need_metadata: bool
+) -> tuple[NoteArrays, int, tuple[int, int], str, str, str] | None:
+    """Parse one file and return (notes, tempo, time_sig, key_sig, title, artist).
+
+    Plain .xml/.musicxml files go through the lxml fast path; music21 is only
+    used for .mxl zip containers, when --need-metadata requires score metadata,
+    or when the fast path cannot handle the file.
+    """
+    if _quick_note_count(filepath) < MIN_NOTES:
+        print(f"  Skipping {filepath}: too few notes (<{MIN_NOTES})")
         return None
 
-    notes = score_to_note_events(score)
-    if len(notes) < 4:
-        print(f"  Skipping {filepath}: too few notes ({len(notes)})")
-        return None
+    basename = Path(filepath).stem.lower().replace(" ", "-").replace("_", "-")
+    title = basename.replace("-", " ").title()
+    artist = "Classical"
 
-    tempo = extract_tempo(score)
-    time_sig = extract_time_signature(score)
-    key_sig = extract_key_signature(score)
-    difficulty = min(5, max(1, estimate_difficulty(notes, tempo)))
+    parsed = None
+    if not need_metadata and not filepath.endswith(".mxl"):
+        parsed = _parse_fast(filepath)
 
-    sections = split_into_sections(notes, time_sig[0])
-    if not sections:
-        return None
+    if parsed is not None:
+        notes, tempo, time_sig, key_sig = parsed
+    else:
+        _import_music21()
+        try:
+            # forceSource bypasses music21's own pickle cache (we cache the
+            # extracted tuple ourselves); quantizePost skips a beat-
+            # quantization pass we don't need — beats come straight from
+            # offsets.
+            if filepath.endswith(".mxl"):
+                score = music21.converter.parseData(
+                    _read_mxl(filepath), format="musicxml", quantizePost=False
+                )
+            else:
+                score = music21.converter.parse(
+                    filepath, forceSource=True, quantizePost=False
+                )
+        except Exception as e:
+            print(f"  Error parsing {filepath}: {e}")
+            return None
+
+        notes, key_sig, time_sig, tempo = _scan_score(score)
+
+        # Try to extract title/artist from metadata
+        if hasattr(score, "metadata") and score.metadata:
+            if score.metadata.title:
+                title = score.metadata.title
+            artist = score.metadata.composer or "Classical"
+
+    return notes, tempo, time_sig, key_sig, title, artist
+
+
+def convert_file(
+    filepath: str, need_metadata: bool = False, use_cache: bool = True
+) -> dict[str, Any] | None:
+    """Convert a single MusicXML file to Song JSON.
+
+    Parsing dominates runtime, so the extracted data (never the music21 Score
+    itself — only the cheap derived tuple) is pickled to ~/.cache/pdmx keyed
+    on the source file's path, mtime, and size. Repeat runs over an unchanged
+    corpus skip parsing entirely. Pass use_cache=False (--no-cache) to force
+    re-extraction.
+    """
+    extracted = None
+    cache_file = None
+    if use_cache:
+        try:
+            cache_file = _cache_path(filepath, need_metadata)
+        except OSError:
+            # Source file vanished or is unreadable: skip caching and let
+            # extraction report the failure for this file only.
+            cache_file = None
+    if cache_file is not None and cache_file.exists():
+        try:
+            extracted = pickle.loads(cache_file.read_bytes())
+        except Exception:
+            extracted = None  # stale/corrupt cache entry: re-extract
+
+    if extracted is None:
+        extracted = _extract(filepath, need_metadata)
+        if extracted is None:
+            return None
+        if cache_file is not None:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_file.write_bytes(pickle.dumps(extracted))
+
+    (starts, durations, pitches), tempo, time_sig, key_sig, title, artist = extracted
 
     # Generate song ID from filename
     basename = Path(filepath).stem.lower().replace(" ", "-").replace("_", "-")
     song_id = f"pdmx-{basename}"
 
-    # Try to extract title/artist from metadata or filename
-    title = basename.replace("-", " ").title()
-    if hasattr(score, "metadata") and score.metadata:
-        if score.metadata.title:
-            title = score.metadata.title
-        artist = score.metadata.composer or "Classical"
-    else:
-        artist = "Classical"
+    if starts.size < MIN_NOTES:
+        print(f"  Skipping {filepath}: too few notes ({starts.size})")
+        return None
+
+    # Fuse the endBeat computation: sectioning, difficulty, and duration all
+    # need starts + durations, so compute the vector once and share it.
+    ends = starts + durations
+
+    difficulty = min(5, max(1, estimate_difficulty(starts, ends, tempo)))
+
+    sections = split_into_sections(starts, durations, pitches, ends, time_sig[0])
+    if not sections:
+        return None
 
     return {
         "id": song_id,
@@ -216,7 +618,7 @@ def convert_file(filepath: str) -> dict[str, Any] | None:
             "artist": artist,
             "genre": "classical",
             "difficulty": difficulty,
-            "durationSeconds": estimate_duration(notes, tempo),
+            "durationSeconds": estimate_duration(ends, tempo),
             "attribution": f"Piano-MIDI.de corpus",
         },
         "sections": sections,
@@ -237,39 +639,96 @@ def convert_file(filepath: str) -> dict[str, Any] | None:
     }
 
 
+def _iter_musicxml(root: str):
+    """Yield MusicXML file paths under root, recursively.
+
+    os.scandir's DirEntry.is_dir() is answered from the readdir data already
+    in hand, unlike os.walk which burns extra stat calls and builds full
+    per-directory name lists — noticeable on corpora with tens of thousands
+    of files.
+    """
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_musicxml(entry.path)
+            elif entry.name.endswith((".xml", ".mxl", ".musicxml")):
+                yield entry.path
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="PDMX MusicXML → Song JSON converter")
     parser.add_argument("--file", help="Single MusicXML file to convert")
     parser.add_argument("--input-dir", help="Directory of MusicXML files")
     parser.add_argument("--output-dir", default="./songs-json", help="Output directory")
+    parser.add_argument(
+        "--need-metadata",
+        action="store_true",
+        help="Extract title/composer from score metadata (forces slower music21 parse)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Skip the on-disk extraction cache and re-parse every file",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent JSON output (default is compact for batch runs)",
+    )
+    parser.add_argument(
+        "--archive",
+        help="Write all songs into a single .tar archive instead of per-song files",
+    )
     args = parser.parse_args()
 
     if not args.file and not args.input_dir:
         parser.error("Provide either --file or --input-dir")
 
-    os.makedirs(args.output_dir, exist_ok=True)
+    if not args.archive:
+        os.makedirs(args.output_dir, exist_ok=True)
 
     files: list[str] = []
     if args.file:
         files = [args.file]
     else:
-        for root, _, filenames in os.walk(args.input_dir):
-            for f in filenames:
-                if f.endswith((".xml", ".mxl", ".musicxml")):
-                    files.append(os.path.join(root, f))
+        files = list(_iter_musicxml(args.input_dir))
 
     print(f"Found {len(files)} MusicXML files to process")
 
+    # Each convert_file call is independent, so fan the parse/extract work out
+    # across all cores; JSON is written back in the main process to avoid
+    # contention on the output directory. chunksize amortizes IPC pickling.
+    convert = functools.partial(
+        convert_file,
+        need_metadata=args.need_metadata,
+        use_cache=not args.no_cache,
+    )
+    # Output files are named by song id, so processing order doesn't affect
+    # results — skip sorting what can be a very large list.
+    # With --archive, thousands of small JSON writes collapse into one
+    # sequential tar stream — a single file handle and no per-song syscalls.
+    archive = tarfile.open(args.archive, "w") if args.archive else None
     success = 0
-    for filepath in sorted(files):
-        print(f"Processing: {filepath}")
-        song = convert_file(filepath)
-        if song:
-            out_path = os.path.join(args.output_dir, f"{song['id']}.json")
-            with open(out_path, "w") as f:
-                json.dump(song, f, indent=2)
-            print(f"  ✓ {song['id']} → {out_path}")
-            success += 1
+    try:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for filepath, song in zip(files, executor.map(convert, files, chunksize=4)):
+                if song:
+                    data = _dump_song(song, args.pretty)
+                    if archive is not None:
+                        info = tarfile.TarInfo(f"{song['id']}.json")
+                        info.size = len(data)
+                        archive.addfile(info, io.BytesIO(data))
+                        print(f"  ✓ {song['id']} → {args.archive}")
+                    else:
+                        out_path = os.path.join(args.output_dir, f"{song['id']}.json")
+                        Path(out_path).write_bytes(data)
+                        print(f"  ✓ {song['id']} → {out_path}")
+                    success += 1
+                else:
+                    print(f"  ✗ {filepath}")
+    finally:
+        if archive is not None:
+            archive.close()
 
     print(f"\nDone! Converted {success}/{len(files)} files")
 
@@ -178,8 +178,8 @@ function validateStructure(song: Song): void {
       addIssue(song, 'error', 'structure', `Melody layer is empty`, section.label);
     }
 
-    // Empty full layer
-    if (!section.layers.full || section.layers.full.length === 0) {
+    // Empty full layer (omitted entirely is fine — normalizeSong defaults it to melody)
+    if (section.layers.full && section.layers.full.length === 0) {
       addIssue(song, 'error', 'structure', `Full layer is empty`, section.label);
     }
 
@@ -0,0 +1,86 @@
+/**
+ * Song Type Helper Tests
+ */
+
+import { normalizeSong } from '../songTypes';
+import type { Song, SongSection } from '../songTypes';
+
+function makeSong(sections: SongSection[]): Song {
+  return {
+    id: 'test-song',
+    version: 1,
+    type: 'song',
+    source: 'pdmx',
+    metadata: {
+      title: 'Test Song',
+      artist: 'Tester',
+      genre: 'classical',
+      difficulty: 2,
+      durationSeconds: 60,
+      attribution: 'test',
+    },
+    sections,
+    settings: {
+      tempo: 100,
+      timeSignature: [4, 4],
+      keySignature: 'C',
+      countIn: 4,
+      metronomeEnabled: true,
+      loopEnabled: true,
+    },
+    scoring: {
+      timingToleranceMs: 50,
+      timingGracePeriodMs: 150,
+      passingScore: 70,
+      starThresholds: [70, 85, 95],
+    },
+  };
+}
+
+const MELODY = [{ note: 60, startBeat: 0, durationBeats: 1 }];
+const FULL = [
+  { note: 60, startBeat: 0, durationBeats: 1 },
+  { note: 48, startBeat: 0, durationBeats: 2 },
+];
+
+function makeSection(layers: SongSection['layers']): SongSection {
+  return {
+    id: 'section-0',
+    label: 'Section 1',
+    startBeat: 0,
+    endBeat: 4,
+    difficulty: 3,
+    layers,
+  };
+}
+
+describe('normalizeSong', () => {
+  it('defaults full to melody when omitted', () => {
+    const song = normalizeSong(makeSong([makeSection({ melody: MELODY })]));
+    expect(song.sections[0].layers.full).toEqual(MELODY);
+  });
+
+  it('keeps an explicit full layer untouched', () => {
+    const song = normalizeSong(
+      makeSong([makeSection({ melody: MELODY, full: FULL })]),
+    );
+    expect(song.sections[0].layers.full).toEqual(FULL);
+  });
+
+  it('normalizes each section independently', () => {
+    const song = normalizeSong(
+      makeSong([
+        makeSection({ melody: MELODY }),
+        makeSection({ melody: MELODY, full: FULL }),
+      ]),
+    );
+    expect(song.sections[0].layers.full).toEqual(MELODY);
+    expect(song.sections[1].layers.full).toEqual(FULL);
+  });
+
+  it('preserves other song fields', () => {
+    const song = normalizeSong(makeSong([makeSection({ melody: MELODY })]));
+    expect(song.id).toBe('test-song');
+    expect(song.metadata.title).toBe('Test Song');
+  });
+});
@@ -36,7 +36,8 @@ export interface SongSection {
   layers: {
     melody: NoteEvent[];
     accompaniment?: NoteEvent[];
-    full: NoteEvent[];
+    /** Omitted by bulk importers when identical to melody; normalizeSong fills it in. */
+    full?: NoteEvent[];
   };
 }
 
@@ -51,6 +52,24 @@ export interface Song {
   scoring: ExerciseScoringConfig;
 }
 
+/**
+ * Fill in defaulted fields on a song loaded from Firestore or JSON.
+ *
+ * Bulk importers store only the melody layer when the full layer would be an
+ * identical copy (halves the serialized payload); restore full := melody here
+ * so consumers can rely on both layers being present.
+ */
+export function normalizeSong(song: Song): Song {
+  return {
+    ...song,
+    sections: song.sections.map((section) =>
+      section.layers.full
+        ? section
+        : { ...section, layers: { ...section.layers, full: section.layers.melody } },
+    ),
+  };
+}
+
 // ---------------------------------------------------------------------------
 // Mastery
 // ---------------------------------------------------------------------------
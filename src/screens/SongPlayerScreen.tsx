@@ -51,7 +51,9 @@ export function sectionToExercise(
   loop: boolean,
 ): Exercise {
   const notes: NoteEvent[] =
-    layer === 'melody' ? section.layers.melody : section.layers.full;
+    layer === 'melody'
+      ? section.layers.melody
+      : section.layers.full ?? section.layers.melody;
 
   // Defensive defaults for settings that might be missing from Firestore data
   const settings = song.settings ?? {} as Song['settings'];
@@ -160,7 +160,7 @@ describe('assembleSong', () => {
 
   it('sets melody notes with right hand', () => {
     const song = assembleSong(validRaw, 'gemini');
-    const fullNotes = song!.sections[0].layers.full;
+    const fullNotes = song!.sections[0].layers.full!;
     expect(fullNotes.every((n) => n.hand === 'right')).toBe(true);
   });
 
@@ -177,7 +177,8 @@ describe('assembleSong', () => {
     };
     const song = assembleSong(withAccomp, 'gemini');
     expect(song).not.toBeNull();
-    const full = song!.sections[0].layers.full;
+    // assembleSong always populates full (melody + optional accompaniment)
+    const full = song!.sections[0].layers.full!;
     // Should have melody (8 notes) + accompaniment (4 notes)
     expect(full.length).toBeGreaterThan(song!.sections[0].layers.melody.length);
     expect(full.some((n) => n.hand === 'left')).toBe(true);
@@ -21,6 +21,7 @@ import {
   type QueryDocumentSnapshot,
 } from 'firebase/firestore';
 import { db } from './firebase/config';
+import { normalizeSong } from '@/core/songs/songTypes';
 import type { Song, SongSummary, SongFilter, SongMastery } from '@/core/songs/songTypes';
 
 // ---------------------------------------------------------------------------
@@ -31,7 +32,7 @@ export async function getSong(songId: string): Promise<Song | null> {
   const ref = doc(db, 'songs', songId);
   const snap = await getDoc(ref);
   if (!snap.exists()) return null;
-  return snap.data() as Song;
+  return normalizeSong(snap.data() as Song);
 }
 
 export async function getSongSummaries(